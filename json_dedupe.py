@@ -42,16 +42,66 @@ Example usage:
         {"nums": [1, 0, 1]}   # This is a duplicate
     ]
     result = solve(input_dicts)
+
+    # Example 4: Streaming, for inputs too large to hold in memory
+    from json_dedupe import iter_solve
+    for d in iter_solve(json.loads(line) for line in open("records.jsonl")):
+        ...
 """
 
+import sys
 import unittest
-from typing import List, Dict, Any, Set, Tuple
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Set, Tuple, Callable, Iterable, Iterator
 import json
-from functools import lru_cache
+from operator import itemgetter
 from collections import defaultdict
 
 # Constants for type checking
 PRIMITIVE_TYPES = (int, float, str, bool)
+# Exact types for the set-based primitive list check in _normalize
+_PRIM_TYPES = frozenset(PRIMITIVE_TYPES)
+# Value types for which a dict is its own key once sorted. bool and float are left out: they
+# need the tags from _normalize_bool and _normalize_float to stay distinct from int
+_FLAT_VALUE_TYPES = frozenset({int, str, type(None)})
+
+# Key computation is spread over a thread pool only on free-threaded builds (3.13t+): with the
+# GIL held by the pure Python normalization, threads would just add overhead
+_PARALLEL = not getattr(sys, "_is_gil_enabled", lambda: True)()
+_PARALLEL_MIN_INPUTS = 1024
+_PARALLEL_CHUNK = 256
+
+# Rank of each kind of normalized value. Values of different kinds never compare directly:
+# the rank decides first. type is the class inside a bool or float tag; anything else (only
+# possible for non-JSON input) ranks last
+_KIND_RANK: Dict[type, int] = {int: 0, float: 0, str: 1, type(None): 2, type: 3, tuple: 4}
+
+def _total_order(normed: Any) -> Tuple[int, Any]:
+    """Ordering key defined between any two normalized values, however they are nested."""
+    rank = _KIND_RANK.get(type(normed), 5)
+    if rank == 4:
+        return (rank, tuple(map(_total_order, normed)))
+    if rank == 3:
+        return (rank, normed.__name__)
+    if rank == 2:
+        return (rank, 0)
+    return (rank, normed)
+
+def _tie_order(normed: Any) -> Tuple[int, Tuple[int, Any]]:
+    return (hash(normed), _total_order(normed))
+
+def _sort_canonical(normed: List) -> None:
+    """
+    Sort normalized list elements into an order-independent canonical order. Sorting by hash
+    keeps comparisons to ints; equal elements tie harmlessly, and only if two unequal elements
+    tie on hash is the list re-sorted with the (much slower) total _tie_order.
+    """
+    normed.sort(key=hash)
+    if len(normed) > 1:
+        distinct_hashes = len(set(map(hash, normed)))
+        if distinct_hashes != len(normed) and distinct_hashes != len(set(normed)):
+            normed.sort(key=_tie_order)
 
 def normalize_value(value: Any) -> Any:
     """
@@ -68,24 +118,126 @@ def normalize_value(value: Any) -> Any:
         return tuple(sorted(normalize_value(x) for x in value))
     return value
 
+def _normalize(value: Any, memo: Dict[int, tuple]) -> Any:
+    """
+    Build the dedup key of value: nested tuples of primitives, with bools and floats tagged
+    and non-primitive lists in _sort_canonical order. memo maps id() of containers already
+    normalized in this pass to their result, so an object referenced several times is only
+    walked once. The caller must keep the inputs alive while memo is in use for the ids to
+    stay valid.
+    """
+    # Exact types go through a single dict lookup; subclasses fall back to isinstance
+    handler = _DISPATCH.get(type(value))
+    if handler is None:
+        if isinstance(value, dict):
+            handler = _normalize_dict
+        elif isinstance(value, list):
+            handler = _normalize_list
+        else:
+            return value
+    return handler(value, memo)
+
+def _normalize_dict(value: Dict, memo: Dict[int, tuple]) -> tuple:
+    result = memo.get(id(value))
+    if result is None:
+        items: Any = value.items()
+        if len(value) > 1:
+            # Sort dictionary items by key only (keys are unique), then normalize their values.
+            # Already sorted dicts (e.g. re-serialized with sort_keys) are a single run for
+            # timsort, which detects that in C faster than a Python-level check could
+            items = sorted(items, key=itemgetter(0))
+        result = tuple([(k, _normalize(v, memo)) for k, v in items])
+        memo[id(value)] = result
+    return result
+
+def _normalize_list(value: List, memo: Dict[int, tuple]) -> tuple:
+    result = memo.get(id(value))
+    if result is None:
+        # Check if list contains only primitives; map and set run in C, empty lists pass
+        types = set(map(type, value))
+        if types <= _PRIM_TYPES:
+            if bool in types or float in types:
+                result = tuple([_normalize(x, memo) for x in value])  # Tag them, keep the order
+            else:
+                result = tuple(value)  # Convert to tuple for hashability
+        else:
+            # For non-primitive lists, sort after normalizing each element (see _sort_canonical)
+            normed = [_normalize(x, memo) for x in value]
+            _sort_canonical(normed)
+            result = tuple(normed)
+        memo[id(value)] = result
+    return result
+
+def _normalize_bool(value: bool, memo: Dict[int, tuple]) -> tuple:
+    # True == 1 and False == 0, so bools are tagged to keep them distinct from ints
+    return (bool, value)
+
+def _normalize_float(value: float, memo: Dict[int, tuple]) -> tuple:
+    # 1.0 == 1, so floats are tagged too. The tag holds the JSON spelling (as json.dumps writes
+    # it), which also keeps -0.0 apart from 0.0 and makes every NaN equal
+    return (float, float.__repr__(value))
+
+_DISPATCH: Dict[type, Callable[[Any, Dict[int, tuple]], Any]] = {
+    dict: _normalize_dict, list: _normalize_list, bool: _normalize_bool,
+    float: _normalize_float
+}
+
+def _parallel_keys(input_dicts: List[Dict], memo: Dict[int, tuple]) -> Iterator[tuple]:
+    """
+    Normalize input_dicts in chunks on a thread pool, yielding the keys in input order.
+    The memo is shared; its dict operations are thread-safe.
+    """
+    chunks = [input_dicts[i:i + _PARALLEL_CHUNK]
+              for i in range(0, len(input_dicts), _PARALLEL_CHUNK)]
+    with ThreadPoolExecutor() as executor:
+        for keys in executor.map(lambda chunk: [_normalize(d, memo) for d in chunk], chunks):
+            yield from keys
+
+def iter_solve(input_dicts: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Lazily deduplicate dictionaries with the same rules as solve, yielding each first
+    occurrence as soon as it is read. Any iterable works, so a large stream never has to be
+    held in memory at once: for iterables other than lists, only the keys of the unique inputs
+    are kept from one input to the next.
+    """
+    seen: Set[Any] = set()
+    # memo is keyed by id(), which is only valid while the object is alive. A list keeps every
+    # input alive for the whole pass, so the memo is shared and sub-objects reused between
+    # dicts are normalized once; items of other iterables may be freed once consumed (and
+    # their ids reused), so there the memo only lives for one input
+    share_memo = isinstance(input_dicts, list)
+    memo: Dict[int, tuple] = {}
+    key: Any
+    
+    if _PARALLEL and isinstance(input_dicts, list) and len(input_dicts) > _PARALLEL_MIN_INPUTS:
+        # Keys are computed on all cores; only the first-occurrence pass stays serial
+        for key, d in zip(_parallel_keys(input_dicts, memo), input_dicts):
+            if key not in seen:
+                seen.add(key)
+                yield d
+        return
+    
+    for d in input_dicts:
+        if set(map(type, d.values())) <= _FLAT_VALUE_TYPES:
+            # Flat dicts (the most common shape) skip the recursion: keys are unique, so
+            # the sorted items are already canonical
+            key = tuple(sorted(d.items()))
+        else:
+            # The normalized value is made of tuples and primitives, so it is the key itself
+            key = _normalize(d, memo)
+            if not share_memo:
+                memo.clear()
+        if key not in seen:
+            seen.add(key)
+            yield d
+
 def solve(input_dicts: List[Dict]) -> List[Dict]:
     """
     Deduplicate a list of dictionaries while respecting the order rules:
     - Lists of primitives maintain their order
     - Everything else is order-independent
     """
-    seen: Set[str] = set()
-    output: List[Dict] = []
-    
-    for d in input_dicts:
-        # First normalize the value, then convert to JSON string
-        normalized_value = normalize_value(d)
-        normalized = json.dumps(normalized_value, sort_keys=True)
-        if normalized not in seen:
-            seen.add(normalized)
-            output.append(d)
-    
-    return output
+    return list(iter_solve(input_dicts))
 
 class TestJsonDedupe(unittest.TestCase):
     def test_1_no_overlap(self):
@@ -182,5 +334,93 @@ class TestJsonDedupe(unittest.TestCase):
         output = solve(input)
         self.assertEqual(len(output), 1)
 
+    def test_7_bools_are_not_ints(self):
+        input = [
+            {"a": True, "b": [1, 0]},
+            {"a": 1, "b": [1, 0]},
+            {"a": True, "b": [True, False]},
+            {"b": [1, 0], "a": True}
+        ]
+        output = solve(input)
+        self.assertEqual(len(output), 3)
+
+    def test_8_mixed_type_lists(self):
+        input = [
+            {"a": [{"x": 1}, {"x": "1"}, 2]},
+            {"a": [2, {"x": "1"}, {"x": 1}]},
+            {"a": [{"x": 1}, {"x": 1}, 2]}
+        ]
+        output = solve(input)
+        self.assertEqual(len(output), 2)
+
+    def test_9_equal_hashes_are_not_duplicates(self):
+        # hash(-1) == hash(-2) in CPython, so keys must be compared, not just hashed
+        input = [
+            {"a": -1},
+            {"a": -2},
+            {"a": [{"b": -1}, {"c": 0}]},
+            {"a": [{"b": -2}, {"c": 0}]}
+        ]
+        output = solve(input)
+        self.assertEqual(len(output), 4)
+
+        # A list element whose hash ties with a sibling's must still sort
+        tie = hash((("x", 1),))
+        output = solve([{"a": [{"x": 1}, tie]}, {"a": [tie, {"x": 1}]}])
+        self.assertEqual(len(output), 1)
+
+    def test_10_iter_solve_streams(self):
+        input = ({"n": i % 3, "tags": [{"t": i % 3}]} for i in range(9))
+        output = iter_solve(input)
+        self.assertEqual(next(output), {"n": 0, "tags": [{"t": 0}]})
+        self.assertEqual(list(output), [
+            {"n": 1, "tags": [{"t": 1}]},
+            {"n": 2, "tags": [{"t": 2}]}
+        ])
+
+    def test_11_normalize_value_is_deterministic(self):
+        # Ordered by value rather than by hash, so this holds for every PYTHONHASHSEED
+        normalized = normalize_value({"a": [{"z": "r"}, {"x": "p"}, {"y": [False, 1]}]})
+        self.assertEqual(normalized, (
+            ("a", ((("x", "p"),), (("y", (False, 1)),), (("z", "r"),))),
+        ))
+        # Public output stays plain JSON data, as it was before bools were tagged in the keys
+        self.assertEqual(json.loads(json.dumps(normalized)),
+                         [["a", [[["x", "p"]], [["y", [False, 1]]], [["z", "r"]]]]])
+
+    def test_12_parallel_keys_match_serial(self):
+        shared = {"x": [1, 2], "y": [{"z": 0}]}
+        input = [
+            {"a": shared, "b": [shared, {"n": i % 5}], "c": [{"m": i % 3}, i % 2 == 0]}
+            for i in range(60)
+        ]
+        expected = solve(input)
+        module = sys.modules[__name__]
+        with mock.patch.object(module, "_PARALLEL", True), \
+                mock.patch.object(module, "_PARALLEL_MIN_INPUTS", 10), \
+                mock.patch.object(module, "_PARALLEL_CHUNK", 7), \
+                mock.patch.object(module, "ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            output = solve(input)
+        pool.assert_called_once()
+        self.assertEqual(output, expected)
+        self.assertEqual(len(output), 30)
+
+    def test_13_ints_and_floats_are_distinct(self):
+        # 1.0 == 1 in Python, but 1 and 1.0 are spelled differently in JSON, so like true and 1
+        # they are not duplicates; equal floats still are
+        input = [
+            {"a": 1},
+            {"a": 1.0},
+            {"a": [1, 2], "b": {"c": 3}},
+            {"a": [1.0, 2], "b": {"c": 3.0}},
+            {"a": [{"c": 3.0}]},
+            {"a": [{"c": 3}]},
+            {"a": 0.0},
+            {"a": -0.0},
+            {"a": 1.0}
+        ]
+        output = solve(input)
+        self.assertEqual(output, input[:-1])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
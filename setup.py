@@ -1,3 +1,5 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -6,6 +8,14 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = fh.read().splitlines()
 
+# Optional compiled build: JSON_DEDUPE_USE_MYPYC=1 pip install . compiles json_dedupe.py with
+# mypyc (needs mypy installed). The pure Python module is still shipped as the fallback.
+ext_modules = []
+if os.environ.get("JSON_DEDUPE_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["json_dedupe.py"])
+
 setup(
     name="json-dedupe",
     version="0.1.0",
@@ -16,6 +26,8 @@ setup(
     long_description_content_type="text/markdown",
     url="[Your Repository URL]",
     packages=find_packages(),
+    py_modules=["json_dedupe"],
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",